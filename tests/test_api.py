@@ -1,8 +1,10 @@
 import datetime as dt
+import json
 import os
 import tempfile
 import unittest
 from random import choice
+from uuid import uuid4
 
 import tscat
 import tscat.orm_sqlalchemy
@@ -263,6 +265,54 @@ class TestAPIAttributes(unittest.TestCase):
         keys = list(sorted(e.variable_attributes().keys()))
         self.assertListEqual(sorted(['other_attr', 'other_attr2']), keys)
 
+    def test_create_events_in_session(self):
+        starts = [dt.datetime(2024, 1, d) for d in range(1, 4)]
+        stops = [dt.datetime(2024, 1, d, 12) for d in range(1, 4)]
+
+        with tscat.Session() as s:
+            events = s.create_events(starts, stops, "Patrick", tags=["tag1", "tag2"], rating=3, field1=1)
+            c = s.create_catalogue("Catalogue Name", "Patrick")
+            s.add_events_to_catalogue(c, events)
+
+        self.assertEqual(len(events), 3)
+        self.assertEqual(len({e.uuid for e in events}), 3)
+        for e, start, stop in zip(events, starts, stops):
+            self.assertEqual(e.start, start)
+            self.assertEqual(e.stop, stop)
+            self.assertEqual(e.author, "Patrick")
+            self.assertListEqual(e.tags, ["tag1", "tag2"])
+            self.assertEqual(e.rating, 3)
+            self.assertEqual(e.field1, 1)
+            self.assertDictEqual(e.variable_attributes(), {'field1': 1})
+
+        self.assertListEqual(get_events(), events)
+        self.assertListEqual(get_events(c)[0], events)
+
+    def test_create_events_in_session_refuses_a_shared_uuid(self):
+        with self.assertRaises(ValueError):
+            with tscat.Session() as s:
+                s.create_events([dt.datetime(2024, 1, 1)], [dt.datetime(2024, 1, 2)], "Patrick",
+                                uuid='7b732d98-da74-11eb-89a0-f3d357f13cae')
+
+    def test_create_events_in_session_refuses_mismatching_starts_and_stops(self):
+        with self.assertRaises(ValueError):
+            with tscat.Session() as s:
+                s.create_events([dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2)], [dt.datetime(2024, 1, 3)],
+                                "Patrick")
+        self.assertListEqual(get_events(), [])
+
+    def test_create_events_in_session_does_not_share_values(self):
+        with tscat.Session() as s:
+            a, b = s.create_events([dt.datetime(2024, 1, 1)] * 2, [dt.datetime(2024, 1, 2)] * 2, "Patrick",
+                                   tags=["tag1"], products=["p1"], a_list=[1, 2])
+
+        a.tags.append("tag2")
+        a.products.append("p2")
+        a.a_list.append(3)
+        self.assertListEqual(b.tags, ["tag1"])
+        self.assertListEqual(b.products, ["p1"])
+        self.assertListEqual(b.a_list, [1, 2])
+
 
 @ddt
 class TestAPIField(unittest.TestCase):
@@ -431,6 +481,22 @@ class TestImportExportJSON(unittest.TestCase):
         with self.assertRaises(ValueError):
             import_json(export_blob)
 
+    def test_exception_raised_upon_catalogue_import_referencing_unknown_events(self):
+        events = [generate_event() for _ in range(2)]
+        catalogue = create_catalogue("TestExportImportCatalogue", "Patrick", events=events)
+
+        export_dict = json.loads(export_json(catalogue))
+        unknown_uuid = str(uuid4())
+        export_dict['catalogues'][0]['events'].append(unknown_uuid)
+
+        discard()
+
+        with self.assertRaisesRegex(ValueError, unknown_uuid):
+            import_json(json.dumps(export_dict))
+
+        self.assertEqual(len(get_events()), 0)
+        self.assertEqual(len(get_catalogues()), 0)
+
     def test_export_import_multiple_catalogues_with_shared_and_individual_events(self):
         shared_events = [generate_event() for _ in range(2)]
 
@@ -4,9 +4,10 @@ from ddt import ddt, data, unpack  # type: ignore
 import tscat.orm_sqlalchemy
 from tscat import create_event, create_catalogue, add_events_to_catalogue, remove_events_from_catalogue, save, discard, \
     get_catalogues, get_events
-from tscat.filtering import Comparison, Field
+from tscat.filtering import Comparison, Field, InCatalogue
 
 import datetime as dt
+import pickle
 import re
 
 
@@ -228,6 +229,20 @@ class TestDynamiccreate_catalogue(unittest.TestCase):
         self.assertTrue(catalogues[1].is_dynamic())
         self.assertEqual(catalogues[1], dcat)
 
+    def test_catalogue_pickled_in_predicate_by_earlier_versions_can_be_unpickled(self):
+        # catalogues pickled inside InCatalogue-predicates before the attribute key-set was tracked
+        legacy = tscat._Catalogue.__new__(tscat._Catalogue)
+        legacy.__dict__.update({'_in_ctor': False, '_removed': False,
+                                'name': 'Legacy', 'author': 'Patrick', 'uuid': '3c0bee4b-d38f-46e7-94d5-8a762a61bbf2',
+                                'tags': ['tag'], 'predicate': None, 'field': 2})
+
+        restored = pickle.loads(pickle.dumps(InCatalogue(legacy), protocol=3))
+
+        self.assertDictEqual(restored.catalogue.variable_attributes(), {'field': 2})
+        self.assertEqual(restored.catalogue.dump()['field'], 2)
+        self.assertIn('attributes(field=2)', repr(restored))
+        self.assertEqual(restored, pickle.loads(pickle.dumps(restored, protocol=3)))
+
     def test_predicate_field_is_updatable(self):
         dc = create_catalogue("Dynamic Catalogue", "Patrick",
                               predicate=Comparison("==", Field("author"), "Patrick"))
@@ -1,6 +1,8 @@
 import datetime as dt
+import functools
 import re
 import unittest
+from typing import Tuple
 
 from ddt import data, ddt, unpack  # type: ignore
 
@@ -9,10 +11,24 @@ from tscat import create_event
 from tscat.filtering import Field, Comparison
 
 
+@functools.lru_cache(maxsize=32)
+def _escaped_repr(seq: Tuple[str, ...]) -> str:
+    return re.escape(str(list(seq)))
+
+
 @ddt
-class TestEvent(unittest.TestCase):
+class TestEventConstructorOK(unittest.TestCase):
+    backend: tscat.orm_sqlalchemy.Backend
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.backend = tscat.orm_sqlalchemy.Backend(testing=True)  # create a memory-database for tests
+
     def setUp(self) -> None:
-        tscat.base._backend = tscat.orm_sqlalchemy.Backend(testing=True)  # create a memory-database for tests
+        tscat.base._backend = self.backend
+
+    def tearDown(self) -> None:
+        tscat.discard()  # some cases use the same UUID, drop what was created instead of recreating the database
 
     @data(
         (dt.datetime.now(), dt.datetime.now() + dt.timedelta(days=1), "Patrick", None, {}),
@@ -51,16 +67,23 @@ class TestEvent(unittest.TestCase):
             self.assertEqual(e.__getattribute__(k), v)
 
         attr_repr = ', '.join(f'{k}={v}' for k, v in attrs.items())
-        tags = re.escape(str(tags))
-        products = re.escape(str(products))
+        tags = _escaped_repr(tuple(tags))
+        products = _escaped_repr(tuple(products))
         r = r'^Event\(start=.*, stop=.*, author=' + author + r', uuid=[0-9a-f-]{36}, tags=' + tags \
             + r', products=' + products + r', rating=None\) attributes\(' + attr_repr + r'\)$'
 
         self.assertRegex(f'{e}', r)
 
+
+@ddt
+class TestEvent(unittest.TestCase):
+    def setUp(self) -> None:
+        tscat.base._backend = tscat.orm_sqlalchemy.Backend(testing=True)  # create a memory-database for tests
+
     @data(
         (dt.datetime.now() + dt.timedelta(days=1), dt.datetime.now(), "", None, {}),
         (dt.datetime.now(), dt.datetime.now() + dt.timedelta(days=1), "", "invalid_uuid", {}),
+        (dt.datetime.now(), dt.datetime.now() + dt.timedelta(days=1), "", "7b732d98-da74-11eb-89a0-f3d357f13cae\n", {}),
         (dt.datetime.now(), dt.datetime.now() + dt.timedelta(days=1), "", None, {"_invalid": 2}),
         (dt.datetime.now(), dt.datetime.now() + dt.timedelta(days=1), "", None, {"'invalid'": 2}),
         (dt.datetime.now(), dt.datetime.now() + dt.timedelta(days=1), "", None, {"'invalid": 2}),
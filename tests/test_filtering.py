@@ -1,6 +1,6 @@
 import unittest
 from ddt import ddt, data, unpack  # type: ignore
-from typing import List
+from typing import Dict, List, Tuple, Union
 
 import tscat.orm_sqlalchemy
 import tscat
@@ -11,18 +11,130 @@ from tscat.filtering import Predicate, Comparison, Field, Attribute, Has, Match,
 
 import datetime as dt
 
-dates = [
-    dt.datetime.now(),
-    dt.datetime.now() + dt.timedelta(days=1),
-    dt.datetime.now() + dt.timedelta(days=2)
-]
-events = []
-catalogues = []
+DATES = (
+    dt.datetime(2024, 1, 1),
+    dt.datetime(2024, 1, 2),
+    dt.datetime(2024, 1, 3),
+)
+
+# the data-tables shared by the event- and catalogue-filtering tests, each row is run as a subTest
+_COMPARISON_DATA: Tuple[Tuple[str, Union[Field, Attribute], Union[str, int], List[int]], ...] = (
+    ('==', Field('author'), 'Patrick', [0]),
+    ('!=', Field('author'), 'Patrick', [1, 2]),
+    ('<', Field('author'), 'Patrick', [1, 2]),
+    ('>', Field('author'), 'Patrick', []),
+    ('<=', Field('author'), 'Patrick', [0, 1, 2]),
+    ('>=', Field('author'), 'Patrick', [0]),
+
+    ('==', Attribute('a'), 1, [0, 1, 2]),
+    ('==', Attribute('a'), 0, []),
+    ('!=', Attribute('a'), 1, []),
+    ('<', Attribute('a'), 1, []),
+    ('<=', Attribute('a'), 1, [0, 1, 2]),
+    ('>', Attribute('a'), 1, []),
+    ('>=', Attribute('a'), 1, [0, 1, 2]),
+
+    ('==', Attribute('b'), 10, [2]),
+    ('==', Attribute('b'), 11, [1]),
+    ('==', Attribute('b'), 12, [0]),
+    ('!=', Attribute('b'), 10, [0, 1]),
+    ('!=', Attribute('b'), 11, [0, 2]),
+    ('!=', Attribute('b'), 12, [1, 2]),
+    ('<', Attribute('b'), 12, [1, 2]),
+    ('<', Attribute('b'), 11, [2]),
+    ('<', Attribute('b'), 10, []),
+    ('<=', Attribute('b'), 12, [0, 1, 2]),
+    ('<=', Attribute('b'), 11, [1, 2]),
+    ('<=', Attribute('b'), 10, [2]),
+    ('>', Attribute('b'), 12, []),
+    ('>', Attribute('b'), 11, [0]),
+    ('>', Attribute('b'), 10, [0, 1]),
+    ('>=', Attribute('b'), 12, [0]),
+    ('>=', Attribute('b'), 11, [0, 1]),
+    ('>=', Attribute('b'), 10, [0, 1, 2]),
+
+    ('==', Attribute('f'), 30, [0]),
+    ('!=', Attribute('f'), 30, []),
+    ('==', Attribute('g'), 30, [1]),
+    ('!=', Attribute('g'), 30, []),
+    ('==', Attribute('h'), 30, [2]),
+    ('!=', Attribute('h'), 30, []),
+
+    ('==', Attribute('s'), 'Hello', [0]),
+    ('==', Attribute('s'), 'World', [1]),
+    ('==', Attribute('s'), 'Goodbye!', [2]),
+)
+
+_DATE_COMPARISON_DATA = (
+    ('==', Field('start'), DATES[0], [0, 2]),
+    ('>', Field('start'), DATES[0], [1]),
+    ('<', Field('stop'), DATES[2], [0]),
+    ('==', Field('stop'), DATES[2], [1, 2]),
+)
+
+_HAS_DATA: Tuple[Tuple[str, List[int]], ...] = (
+    ('a', [0, 1, 2]),
+    ('b', [0, 1, 2]),
+    ('s', [0, 1, 2]),
+    ('f', [0]),
+    ('g', [1]),
+    ('h', [2]),
+    ('u', []),
+)
+
+_MATCH_DATA = (
+    (Field('author'), r'a', [0, 2]),
+    (Field('author'), r'A', [1]),
+    (Field('author'), r's$', [1, 2]),
+    (Field('author'), r'^[AN]{1}.*s$', [1, 2]),
+    (Attribute('s'), r'!$', [2]),
+    (Attribute('s'), r'^G', [2]),
+)
+
+_LOGIC_DATA: Tuple[Tuple[Predicate, List[int]], ...] = (
+    (All(Match(Field('author'), r'a'), Has(Attribute('h'))), [2]),
+    (Any(Match(Field('author'), r'a'), Has(Attribute('h'))), [0, 2]),
+    (All(Match(Field('author'), r'a'), Has(Attribute('g'))), []),
+    (All(Match(Field('author'), r'a'), Not(Has(Attribute('g')))), [0, 2]),
+    (Any(Match(Field('author'), r'a'), Has(Attribute('g'))), [0, 1, 2]),
+)
+
+IN_NAME_SL = In('name', Attribute('sl'))
+IN_TAGA_SL = In('tagA', Attribute('sl'))
+IN_TAGAA_SL = In('tagAA', Attribute('sl'))
+IN_TAG1_SL = In('tag1', Attribute('sl'))
+IN_TAGC_SL = In('tagc', Attribute('sl'))
+IN_T_SL = In('t', Attribute('sl'))
+IN_T_TAGS = In('t', Field("tags"))
+IN_TAG2_TAGS = In('tag2', Field("tags"))
+IN_PRD1_PRODUCTS = In('prd1', Field("products"))
+IN_PRD2_PRODUCTS = In('prd2', Field("products"))
+
+_STRING_LIST_DATA: Tuple[Tuple[Predicate, List[int]], ...] = (
+    (IN_NAME_SL, [0, 1]),
+    (IN_TAGA_SL, [1]),
+    (IN_TAGAA_SL, [0]),
+    (IN_TAG1_SL, [1]),
+    (Any(IN_TAG1_SL, IN_TAGC_SL), [1, 2]),
+    (Any(IN_T_SL), []),
+
+    # fields
+    (IN_T_TAGS, []),
+    (IN_TAG2_TAGS, [0, 1]),
+    (IN_PRD1_PRODUCTS, [1]),
+    (All(IN_PRD1_PRODUCTS, IN_PRD2_PRODUCTS), [1]),
+)
 
 # initialize the backend to testing before anything is done on the datebase
 tscat.base._backend = tscat.orm_sqlalchemy.Backend(testing=True)
 
 
+class _UnorderedResultTestCase(unittest.TestCase):
+    # the backend does not guarantee any order of the returned results
+    def assertUnorderedEntitiesEqual(self, result: List, expected: List) -> None:
+        self.assertListEqual(sorted(result, key=lambda e: e.uuid), sorted(expected, key=lambda e: e.uuid))
+
+
 @ddt
 class TestFilterRepr(unittest.TestCase):
     @data(
@@ -45,277 +157,128 @@ class TestFilterRepr(unittest.TestCase):
         self.assertEqual(f'{pred}', expected)
 
 
-@ddt
-class TestEventFiltering(unittest.TestCase):
+class TestEventFiltering(_UnorderedResultTestCase):
+    events: List[_Event]
+    _expected_cache: Dict[Tuple[int, ...], List[_Event]]
+
     @classmethod
     def setUpClass(cls) -> None:
         tscat.base._backend = tscat.orm_sqlalchemy.Backend(testing=True)
 
-        global events
-        events = [
-            create_event(dates[0], dates[1], "Patrick", a=1, b=12, f=30, s='Hello'),
-            create_event(dates[1], dates[2], "Alexis", a=1, b=11, g=30, s='World'),
-            create_event(dates[0], dates[2], "Nicolas", a=1, b=10, h=30, s='Goodbye!'),
+        cls.events = [
+            create_event(DATES[0], DATES[1], "Patrick", a=1, b=12, f=30, s='Hello'),
+            create_event(DATES[1], DATES[2], "Alexis", a=1, b=11, g=30, s='World'),
+            create_event(DATES[0], DATES[2], "Nicolas", a=1, b=10, h=30, s='Goodbye!'),
         ]
-
-    @data(
-        ('==', Field('author'), 'Patrick', [0]),
-        ('!=', Field('author'), 'Patrick', [1, 2]),
-        ('<', Field('author'), 'Patrick', [1, 2]),
-        ('>', Field('author'), 'Patrick', []),
-        ('<=', Field('author'), 'Patrick', [0, 1, 2]),
-        ('>=', Field('author'), 'Patrick', [0]),
-
-        ('==', Field('start'), dates[0], [0, 2]),
-        ('>', Field('start'), dates[0], [1]),
-        ('<', Field('stop'), dates[2], [0]),
-        ('==', Field('stop'), dates[2], [1, 2]),
-
-        ('==', Attribute('a'), 1, [0, 1, 2]),
-        ('==', Attribute('a'), 0, []),
-        ('!=', Attribute('a'), 1, []),
-        ('<', Attribute('a'), 1, []),
-        ('<=', Attribute('a'), 1, [0, 1, 2]),
-        ('>', Attribute('a'), 1, []),
-        ('>=', Attribute('a'), 1, [0, 1, 2]),
-
-        ('==', Attribute('b'), 10, [2]),
-        ('==', Attribute('b'), 11, [1]),
-        ('==', Attribute('b'), 12, [0]),
-        ('!=', Attribute('b'), 10, [0, 1]),
-        ('!=', Attribute('b'), 11, [0, 2]),
-        ('!=', Attribute('b'), 12, [1, 2]),
-        ('<', Attribute('b'), 12, [1, 2]),
-        ('<', Attribute('b'), 11, [2]),
-        ('<', Attribute('b'), 10, []),
-        ('<=', Attribute('b'), 12, [0, 1, 2]),
-        ('<=', Attribute('b'), 11, [1, 2]),
-        ('<=', Attribute('b'), 10, [2]),
-        ('>', Attribute('b'), 12, []),
-        ('>', Attribute('b'), 11, [0]),
-        ('>', Attribute('b'), 10, [0, 1]),
-        ('>=', Attribute('b'), 12, [0]),
-        ('>=', Attribute('b'), 11, [0, 1]),
-        ('>=', Attribute('b'), 10, [0, 1, 2]),
-
-        ('==', Attribute('f'), 30, [0]),
-        ('!=', Attribute('f'), 30, []),
-        ('==', Attribute('g'), 30, [1]),
-        ('!=', Attribute('g'), 30, []),
-        ('==', Attribute('h'), 30, [2]),
-        ('!=', Attribute('h'), 30, []),
-
-        ('==', Attribute('s'), 'Hello', [0]),
-        ('==', Attribute('s'), 'World', [1]),
-        ('==', Attribute('s'), 'Goodbye!', [2]),
-    )
-    @unpack
-    def test_comparison(self, op, lhs, rhs, idx):
-        event_list = get_events(Comparison(op, lhs, rhs))
-        self.assertListEqual(event_list, [events[i] for i in idx])
-
-    @data(
-        ('a', [0, 1, 2]),
-        ('b', [0, 1, 2]),
-        ('s', [0, 1, 2]),
-        ('f', [0]),
-        ('g', [1]),
-        ('h', [2]),
-        ('u', [])
-    )
-    @unpack
-    def test_has_attribute(self, attr, idx):
-        event_list = get_events(Has(Attribute(attr)))
-        self.assertListEqual(event_list, [events[i] for i in idx])
-
-    @data(
-        (Field('author'), r'a', [0, 2]),
-        (Field('author'), r'A', [1]),
-        (Field('author'), r's$', [1, 2]),
-        (Field('author'), r'^[AN]{1}.*s$', [1, 2]),
-        (Attribute('s'), r'!$', [2]),
-        (Attribute('s'), r'^G', [2]),
-    )
-    @unpack
-    def test_match(self, field_or_attr, pattern, idx):
-        event_list = get_events(Match(field_or_attr, pattern))
-        self.assertListEqual(event_list, [events[i] for i in idx])
-
-    @data(
-        (All(Match(Field('author'), r'a'), Has(Attribute('h'))), [2]),
-        (Any(Match(Field('author'), r'a'), Has(Attribute('h'))), [0, 2]),
-        (All(Match(Field('author'), r'a'), Has(Attribute('g'))), []),
-        (All(Match(Field('author'), r'a'), Not(Has(Attribute('g')))), [0, 2]),
-        (Any(Match(Field('author'), r'a'), Has(Attribute('g'))), [0, 1, 2]),
-    )
-    @unpack
-    def test_logical_combinations(self, pred, idx):
-        event_list = get_events(All(pred))
-        self.assertListEqual(event_list, [events[i] for i in idx])
+        cls._expected_cache = {}
+
+    def _expected(self, idx: List[int]) -> List[_Event]:
+        key = tuple(idx)
+        if key not in self._expected_cache:
+            self._expected_cache[key] = [self.events[i] for i in idx]
+        return self._expected_cache[key]
+
+    def test_comparison(self):
+        for op, lhs, rhs, idx in (*_DATE_COMPARISON_DATA, *_COMPARISON_DATA):
+            with self.subTest(op=op, lhs=lhs, rhs=rhs):
+                event_list = get_events(Comparison(op, lhs, rhs))
+                self.assertUnorderedEntitiesEqual(event_list, self._expected(idx))
+
+    def test_has_attribute(self):
+        for attr, idx in _HAS_DATA:
+            with self.subTest(attr=attr):
+                event_list = get_events(Has(Attribute(attr)))
+                self.assertUnorderedEntitiesEqual(event_list, self._expected(idx))
+
+    def test_match(self):
+        for field_or_attr, pattern, idx in _MATCH_DATA:
+            with self.subTest(field_or_attr=field_or_attr, pattern=pattern):
+                event_list = get_events(Match(field_or_attr, pattern))
+                self.assertUnorderedEntitiesEqual(event_list, self._expected(idx))
+
+    def test_logical_combinations(self):
+        for pred, idx in _LOGIC_DATA:
+            with self.subTest(pred=pred):
+                event_list = get_events(All(pred))
+                self.assertUnorderedEntitiesEqual(event_list, self._expected(idx))
 
     def test_get_only_manually_added_events_from_dynamic_catalogue(self):
         cat = create_catalogue('T', 'A')
         cat.predicate = Comparison("==", Field('author'), 'Patrick')
 
-        assert get_events(cat)[0] == [events[0]]
+        assert get_events(cat)[0] == [self.events[0]]
 
-        add_events_to_catalogue(cat, events[1])
-        assert get_events(cat)[0] == [events[0], events[1]]
+        add_events_to_catalogue(cat, self.events[1])
+        assert get_events(cat)[0] == [self.events[0], self.events[1]]
 
-        assert get_events(cat, assigned_only=True)[0] == [events[1]]
+        assert get_events(cat, assigned_only=True)[0] == [self.events[1]]
+
+
+class TestStringListAttributes(_UnorderedResultTestCase):
+    events: List[_Event]
 
-@ddt
-class TestStringListAttributes(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         tscat.base._backend = tscat.orm_sqlalchemy.Backend(testing=True)
 
-        global events
-        events = [
-            create_event(dates[0], dates[2], "Patrick", tags=["tag1", "tag2"], sl=["name", "tagAA"]),
-            create_event(dates[0], dates[2], "Someone", tags=["tag2", "tag3"], products=["prd1", "prd2"],
+        cls.events = [
+            create_event(DATES[0], DATES[2], "Patrick", tags=["tag1", "tag2"], sl=["name", "tagAA"]),
+            create_event(DATES[0], DATES[2], "Someone", tags=["tag2", "tag3"], products=["prd1", "prd2"],
                          sl=["tag1", "tagA", "name"]),
-            create_event(dates[0], dates[2], "Person", sl=["tagc", "taga"]),
+            create_event(DATES[0], DATES[2], "Person", sl=["tagc", "taga"]),
         ]
 
     def test_(self):
-        event_list = get_events(In('name', Attribute('sl')))
-        self.assertListEqual(event_list, events[0:2])
-
-        event_list = get_events(In('tagA', Attribute('sl')))
-        self.assertListEqual(event_list, [events[1]])
+        for pred, idx in _STRING_LIST_DATA:
+            with self.subTest(pred=pred):
+                event_list = get_events(pred)
+                self.assertUnorderedEntitiesEqual(event_list, [self.events[i] for i in idx])
 
-        event_list = get_events(In('tagAA', Attribute('sl')))
-        self.assertListEqual(event_list, [events[0]])
-
-        event_list = get_events(In('tag1', Attribute('sl')))
-        self.assertListEqual(event_list, [events[1]])
-
-        event_list = get_events(Any(In('tag1', Attribute('sl')),
-                                    In('tagc', Attribute('sl'))))
-        self.assertListEqual(event_list, [events[1], events[2]])
-
-        event_list = get_events(Any(In('t', Attribute('sl'))))
-        self.assertListEqual(event_list, [])
-
-        # fields
-        event_list = get_events(In('t', Field("tags")))
-        self.assertListEqual(event_list, [])
-
-        event_list = get_events(In('tag2', Field("tags")))
-        self.assertListEqual(event_list, events[0:2])
-
-        event_list = get_events(In('prd1', Field("products")))
-        self.assertListEqual(event_list, [events[1]])
-
-        event_list = get_events(All(
-            In('prd1', Field("products")),
-            In('prd2', Field("products"))))
-        self.assertListEqual(event_list, [events[1]])
 
+class TestCatalogueFiltering(_UnorderedResultTestCase):
+    catalogues: List[_Catalogue]
+    _expected_cache: Dict[Tuple[int, ...], List[_Catalogue]]
 
-@ddt
-class TestCatalogueFiltering(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         tscat.base._backend = tscat.orm_sqlalchemy.Backend(testing=True)
 
-        global catalogues
-        catalogues = [
+        cls.catalogues = [
             create_catalogue('Catalogue A', "Patrick", a=1, b=12, f=30, s='Hello'),
             create_catalogue('Catalogue B', "Alexis", a=1, b=11, g=30, s='World'),
             create_catalogue('Catalogue C', "Nicolas", a=1, b=10, h=30, s='Goodbye!'),
         ]
-
-    @data(
-        ('==', Field('author'), 'Patrick', [0]),
-        ('!=', Field('author'), 'Patrick', [1, 2]),
-        ('<', Field('author'), 'Patrick', [1, 2]),
-        ('>', Field('author'), 'Patrick', []),
-        ('<=', Field('author'), 'Patrick', [0, 1, 2]),
-        ('>=', Field('author'), 'Patrick', [0]),
-
-        ('==', Attribute('a'), 1, [0, 1, 2]),
-        ('==', Attribute('a'), 0, []),
-        ('!=', Attribute('a'), 1, []),
-        ('<', Attribute('a'), 1, []),
-        ('<=', Attribute('a'), 1, [0, 1, 2]),
-        ('>', Attribute('a'), 1, []),
-        ('>=', Attribute('a'), 1, [0, 1, 2]),
-
-        ('==', Attribute('b'), 10, [2]),
-        ('==', Attribute('b'), 11, [1]),
-        ('==', Attribute('b'), 12, [0]),
-        ('!=', Attribute('b'), 10, [0, 1]),
-        ('!=', Attribute('b'), 11, [0, 2]),
-        ('!=', Attribute('b'), 12, [1, 2]),
-        ('<', Attribute('b'), 12, [1, 2]),
-        ('<', Attribute('b'), 11, [2]),
-        ('<', Attribute('b'), 10, []),
-        ('<=', Attribute('b'), 12, [0, 1, 2]),
-        ('<=', Attribute('b'), 11, [1, 2]),
-        ('<=', Attribute('b'), 10, [2]),
-        ('>', Attribute('b'), 12, []),
-        ('>', Attribute('b'), 11, [0]),
-        ('>', Attribute('b'), 10, [0, 1]),
-        ('>=', Attribute('b'), 12, [0]),
-        ('>=', Attribute('b'), 11, [0, 1]),
-        ('>=', Attribute('b'), 10, [0, 1, 2]),
-
-        ('==', Attribute('f'), 30, [0]),
-        ('!=', Attribute('f'), 30, []),
-        ('==', Attribute('g'), 30, [1]),
-        ('!=', Attribute('g'), 30, []),
-        ('==', Attribute('h'), 30, [2]),
-        ('!=', Attribute('h'), 30, []),
-
-        ('==', Attribute('s'), 'Hello', [0]),
-        ('==', Attribute('s'), 'World', [1]),
-        ('==', Attribute('s'), 'Goodbye!', [2]),
-    )
-    @unpack
-    def test_comparison(self, op, lhs, rhs, idx):
-        catalogue_list = get_catalogues(Comparison(op, lhs, rhs))
-        self.assertListEqual(catalogue_list, [catalogues[i] for i in idx])
-
-    @data(
-        ('a', [0, 1, 2]),
-        ('b', [0, 1, 2]),
-        ('s', [0, 1, 2]),
-        ('f', [0]),
-        ('g', [1]),
-        ('h', [2]),
-        ('u', [])
-    )
-    @unpack
-    def test_has_attribute(self, attr, idx):
-        catalogue_list = get_catalogues(Has(Attribute(attr)))
-        self.assertListEqual(catalogue_list, [catalogues[i] for i in idx])
-
-    @data(
-        (Field('author'), r'a', [0, 2]),
-        (Field('author'), r'A', [1]),
-        (Field('author'), r's$', [1, 2]),
-        (Field('author'), r'^[AN]{1}.*s$', [1, 2]),
-        (Attribute('s'), r'!$', [2]),
-        (Attribute('s'), r'^G', [2]),
-    )
-    @unpack
-    def test_match(self, field_or_attr, pattern, idx):
-        catalogue_list = get_catalogues(Match(field_or_attr, pattern))
-        self.assertListEqual(catalogue_list, [catalogues[i] for i in idx])
-
-    @data(
-        (All(Match(Field('author'), r'a'), Has(Attribute('h'))), [2]),
-        (Any(Match(Field('author'), r'a'), Has(Attribute('h'))), [0, 2]),
-        (All(Match(Field('author'), r'a'), Has(Attribute('g'))), []),
-        (All(Match(Field('author'), r'a'), Not(Has(Attribute('g')))), [0, 2]),
-        (Any(Match(Field('author'), r'a'), Has(Attribute('g'))), [0, 1, 2]),
-    )
-    @unpack
-    def test_logical_combinations(self, pred, idx):
-        catalogue_list = get_catalogues(All(pred))
-        self.assertListEqual(catalogue_list, [catalogues[i] for i in idx])
+        cls._expected_cache = {}
+
+    def _expected(self, idx: List[int]) -> List[_Catalogue]:
+        key = tuple(idx)
+        if key not in self._expected_cache:
+            self._expected_cache[key] = [self.catalogues[i] for i in idx]
+        return self._expected_cache[key]
+
+    def test_comparison(self):
+        for op, lhs, rhs, idx in _COMPARISON_DATA:
+            with self.subTest(op=op, lhs=lhs, rhs=rhs):
+                catalogue_list = get_catalogues(Comparison(op, lhs, rhs))
+                self.assertUnorderedEntitiesEqual(catalogue_list, self._expected(idx))
+
+    def test_has_attribute(self):
+        for attr, idx in _HAS_DATA:
+            with self.subTest(attr=attr):
+                catalogue_list = get_catalogues(Has(Attribute(attr)))
+                self.assertUnorderedEntitiesEqual(catalogue_list, self._expected(idx))
+
+    def test_match(self):
+        for field_or_attr, pattern, idx in _MATCH_DATA:
+            with self.subTest(field_or_attr=field_or_attr, pattern=pattern):
+                catalogue_list = get_catalogues(Match(field_or_attr, pattern))
+                self.assertUnorderedEntitiesEqual(catalogue_list, self._expected(idx))
+
+    def test_logical_combinations(self):
+        for pred, idx in _LOGIC_DATA:
+            with self.subTest(pred=pred):
+                catalogue_list = get_catalogues(All(pred))
+                self.assertUnorderedEntitiesEqual(catalogue_list, self._expected(idx))
 
 
 @ddt
@@ -370,10 +333,10 @@ class TestEventFilteringOnCatalogues(unittest.TestCase):
         self.d = create_catalogue('Catalogue B', "Patrick")
 
         self.events = [
-            create_event(dates[0], dates[1], "Patrick"),
-            create_event(dates[1], dates[2], "Alexis"),
-            create_event(dates[0], dates[2], "Nicolas"),
-            create_event(dates[0], dates[2], "Toto"),
+            create_event(DATES[0], DATES[1], "Patrick"),
+            create_event(DATES[1], DATES[2], "Alexis"),
+            create_event(DATES[0], DATES[2], "Nicolas"),
+            create_event(DATES[0], DATES[2], "Toto"),
         ]
         add_events_to_catalogue(self.c, [self.events[1], self.events[3]])
         add_events_to_catalogue(self.d, [self.events[2], self.events[3]])
@@ -38,6 +38,16 @@ class TestPerformance(unittest.TestCase):
             c = s.create_catalogue('TestP', 'Patrick')
             s.add_events_to_catalogue(c, events)
 
+    @pytest.mark.timeout(3)
+    def test_create_events_in_bulk_w_keywords_w_context_manager(self):
+        with tscat.Session() as s:
+            events = s.create_events([start] * 10000, [stop] * 10000, author='Patrick',
+                                     field1=1, field2=1, tags=['tag1', 'tag2'])
+            c = s.create_catalogue('TestP', 'Patrick')
+            s.add_events_to_catalogue(c, events)
+
+        self.assertEqual(len(tscat.get_events(c)[0]), 10000)
+
     @pytest.mark.timeout(3.5)
     def test_get(self):
         with tscat.Session() as s:
@@ -1,7 +1,10 @@
+import copy
 import datetime as dt
+import itertools
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Tuple, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, TYPE_CHECKING, Tuple, Union
 from uuid import UUID, uuid4
 
 from . import orm_sqlalchemy
@@ -11,6 +14,15 @@ if TYPE_CHECKING:
     from .orm_sqlalchemy.orm import Event, Catalogue
 
 _valid_key = re.compile(r'^[A-Za-z][A-Za-z_0-9]*$')
+_uuid_form = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_key(key: str) -> bool:
+    if key.isascii() and key.isidentifier():  # cheap check for the common case, same result as the regex
+        return key[0] != '_'
+    return _valid_key.match(key) is not None
+
 
 _backend = None
 
@@ -26,16 +38,38 @@ def _listify(v) -> Union[List, Tuple]:
     if isinstance(v, (list, tuple)):
         return v
     else:
-        return [v]
+        return (v,)
 
 
 def _verify_attribute_names(kwargs: Dict) -> Dict:
     for k in kwargs.keys():
-        if not _valid_key.match(k):
+        if not _is_valid_key(k):
             raise ValueError('Invalid key-name for event-meta-data in kwargs:', k)
     return kwargs
 
 
+def _check_uuid(value: str) -> None:
+    # the canonical string form is by far the most common, only parse anything else
+    if not (isinstance(value, str) and _uuid_form.fullmatch(value)):
+        UUID(value, version=4)  # throws an exception if not valid
+
+
+def _check_string_list(value: Iterable) -> None:
+    for v in value:
+        if not isinstance(v, str):
+            raise ValueError("a tag has to be a string")
+        if ',' in v:
+            raise ValueError("a string-list value shall not contain a comma")
+
+
+def _check_rating(value: Optional[int]) -> None:
+    if value is not None:
+        if not isinstance(value, int):
+            raise ValueError("rating has to be an integer value")
+        if value < 1 or value > 10:
+            raise ValueError("rating has to be between 1 and 10")
+
+
 class Session:
     def __init__(self) -> None:
         self.entities: List[Union['Event', 'Catalogue']] = []
@@ -51,6 +85,27 @@ class Session:
         self.entities.append(e._backend_entity)
         return e
 
+    def create_events(self, starts: Iterable[dt.datetime], stops: Iterable[dt.datetime], author: str,
+                      **kwargs: Any) -> List['_Event']:
+        if 'uuid' in kwargs:
+            raise ValueError('create_events: a uuid cannot be shared by several events')
+        starts, stops = list(starts), list(stops)
+        if len(starts) != len(stops):
+            raise ValueError(f'create_events: got {len(starts)} starts but {len(stops)} stops')
+        events, payloads = [], []
+        for start, stop in zip(starts, stops):
+            # every event owns its values, mutating a list-attribute of one must not alter the others
+            event_kwargs = copy.deepcopy(kwargs)
+            event = _Event(start, stop, author, _insert=False, **event_kwargs)
+            events.append(event)
+            payloads.append(event._backend_payload({k: v for k, v in event_kwargs.items()
+                                                    if k not in _Event._fixed_keys}))
+        entities = backend().add_events(payloads)
+        for e, entity in zip(events, entities):
+            e.__dict__['_backend_entity'] = entity
+        self.entities.extend(entities)
+        return events
+
     def create_catalogue(self, *args: Any, **kwargs: Any) -> '_Catalogue':
         c = _Catalogue(*args, **kwargs)
         self.entities.append(c._backend_entity)
@@ -70,6 +125,7 @@ class Session:
 class _BackendBasedEntity:
     def __init__(self):
         self._removed = False
+        self._variable_keys: Set[str] = set()
 
     def representation(self, name: str) -> str:
         fix = ', '.join(k + '=' + str(v) for k, v in self.fixed_attributes().items())
@@ -84,31 +140,35 @@ class _BackendBasedEntity:
         return ret
 
     def variable_attributes(self) -> dict:
-        ret = {}
-        for k, v in self.__dict__.items():
-            if k in self._fixed_keys:
-                continue
-            if _valid_key.match(k):
-                ret[k] = v
-        return ret
+        # iterate __dict__ rather than the key-set to keep the attributes in assignment order
+        variable_keys = self._variable_keys
+        return {k: v for k, v in self.__dict__.items() if k in variable_keys}
 
     def fixed_attributes(self) -> dict:
-        return {k: self.__dict__[k] for k in self._fixed_keys}
+        return {k: self.__dict__[k] for k in self._fixed_keys_order}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        # entities pickled into predicates by earlier versions do not carry the attribute key-set
+        if '_variable_keys' not in state:
+            self.__dict__['_variable_keys'] = {k for k in state if k not in self._fixed_keys and _is_valid_key(k)}
 
     def __getattr__(self, name):
         if name == '_backend_entity' and name not in self.__dict__:
             raise ValueError("You are attempting an operation on an invalid object, " +
                              "this may be because your object has been deleted, please try creating or " +
                              "getting a new one.")
-        return super(_BackendBasedEntity, self).__getattr__(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __setattr__(self, key, value):
         super(_BackendBasedEntity, self).__setattr__(key, value)
 
-        if key != '_in_ctor' and not self._in_ctor:
-            if key in self._fixed_keys:
+        if key in self._fixed_keys:
+            if not self._in_ctor:
                 backend().update_field(self._backend_entity, key, value)
-            elif _valid_key.match(key):
+        elif _is_valid_key(key):
+            self._variable_keys.add(key)
+            if not self._in_ctor:
                 backend().update_attribute(self._backend_entity, key, value)
 
     def __delattr__(self, key):
@@ -117,15 +177,18 @@ class _BackendBasedEntity:
         # only allow deletion of attributes
         if key in self._fixed_keys:
             raise IndexError('Fixed keys cannot be deleted.')
-        if _valid_key.match(key):
+        if _is_valid_key(key):
+            self._variable_keys.discard(key)
             backend().delete_attribute(self._backend_entity, key)
 
     def __eq__(self, o):
-        if sorted(filter(_valid_key.match, self.__dict__.keys())) != \
-            sorted(filter(_valid_key.match, o.__dict__.keys())):
+        if not isinstance(o, _BackendBasedEntity):
+            return NotImplemented
+
+        if self._fixed_keys != o._fixed_keys or self._variable_keys != o._variable_keys:
             return False
 
-        for k in sorted(filter(_valid_key.match, self.__dict__.keys())):
+        for k in itertools.chain(self._fixed_keys, self._variable_keys):
             if self.__dict__[k] != o.__dict__[k]:
                 return False
         return True
@@ -146,7 +209,8 @@ class _BackendBasedEntity:
 
 
 class _Event(_BackendBasedEntity):
-    _fixed_keys = ['start', 'stop', 'author', 'uuid', 'tags', 'products', 'rating']
+    _fixed_keys_order = ('start', 'stop', 'author', 'uuid', 'tags', 'products', 'rating')
+    _fixed_keys = frozenset(_fixed_keys_order)
 
     def __init__(self, start: dt.datetime, stop: dt.datetime,
                  author: str,
@@ -159,55 +223,95 @@ class _Event(_BackendBasedEntity):
         self._in_ctor = True
         super().__init__()
 
-        self.start = start
-        self.stop = stop
-        self.author = author
-        self.tags = list(tags)
-        self.products = list(products)
-        self.rating = rating
-
+        # validate once and store the fixed fields directly, instead of going through __setattr__ for each
+        tags = list(tags)
+        products = list(products)
+        if stop < start:
+            raise ValueError("stop date has to be after start date")
+        _check_string_list(tags)
+        _check_string_list(products)
+        _check_rating(rating)
         if not uuid:
-            self.uuid = str(uuid4())
+            uuid = str(uuid4())
         else:
-            self.uuid = uuid
+            _check_uuid(uuid)
 
         _verify_attribute_names(kwargs)
-        self.__dict__.update(kwargs)
+        # keep the field order of _fields_from_backend, dump() and the exports follow it
+        self.__dict__.update({
+            'start': start,
+            'stop': stop,
+            'author': author,
+            'tags': tags,
+            'products': products,
+            'rating': rating,
+            'uuid': uuid,
+            **kwargs,
+        })
+        self._variable_keys.update(kwargs)
 
         if _insert:
-            self._backend_entity = backend().add_event({
-                'start': self.start,
-                'stop': self.stop,
-                'author': self.author,
-                'uuid': self.uuid,
-                'tags': self.tags,
-                'products': self.products,
-                'rating': self.rating,
-                'attributes': kwargs,
-            })
+            self._backend_entity = backend().add_event(self._backend_payload(kwargs))
 
         self._in_ctor = False
 
+    def _backend_payload(self, attributes: Dict) -> Dict:
+        return {
+            'start': self.start,
+            'stop': self.stop,
+            'author': self.author,
+            'uuid': self.uuid,
+            'tags': self.tags,
+            'products': self.products,
+            'rating': self.rating,
+            'attributes': attributes,
+        }
+
+    @classmethod
+    def _from_backend(cls, ev: Dict, removed: bool) -> '_Event':
+        # values coming from the backend have already been validated, bypass __init__ and __setattr__
+        e = cls.__new__(cls)
+        e.__dict__.update({
+            '_in_ctor': False,
+            '_removed': removed,
+            '_variable_keys': set(ev['attributes']),
+            **cls._fields_from_backend(ev),
+        })
+        e.__dict__.update(ev['attributes'])
+        e.__dict__['_backend_entity'] = ev['entity']
+        return e
+
+    @staticmethod
+    def _fields_from_backend(ev: Dict) -> Dict:
+        # fixed fields of a backend row, in the order the event stores them - and thus dump() returns them
+        return {
+            'start': ev['start'],
+            'stop': ev['stop'],
+            'author': ev['author'],
+            'tags': list(ev['tags']),
+            'products': list(ev['products']),
+            'rating': ev['rating'],
+            'uuid': ev['uuid'],
+        }
+
+    @classmethod
+    def _dump_from_backend(cls, ev: Dict) -> Dict:
+        # same result as cls._from_backend(ev, ...).dump(), without creating the event
+        return {**ev['attributes'], **cls._fields_from_backend(ev)}
+
     def __setattr__(self, key, value):
         if key == 'uuid':
-            UUID(value, version=4)  # throws an exception if not valid
-        elif key == 'start' and hasattr(self, 'stop'):
-            if value > self.stop:
+            _check_uuid(value)
+        elif key == 'start' and 'stop' in self.__dict__:
+            if value > self.__dict__['stop']:
                 raise ValueError("start date has to be before stop date")
-        elif key == 'stop' and hasattr(self, 'start'):
-            if value < self.start:
+        elif key == 'stop' and 'start' in self.__dict__:
+            if value < self.__dict__['start']:
                 raise ValueError("stop date has to be after start date")
         elif key in ['tags', 'products']:
-            if any(not isinstance(v, str) for v in value):
-                raise ValueError("a tag has to be a string")
-            if any(',' in v for v in value):
-                raise ValueError("a string-list value shall not contain a comma")
+            _check_string_list(value)
         elif key == 'rating':
-            if value is not None:
-                if not isinstance(value, int):
-                    raise ValueError("rating has to be an integer value")
-                if value < 1 or value > 10:
-                    raise ValueError("rating has to be between 1 and 10")
+            _check_rating(value)
 
         super(_Event, self).__setattr__(key, value)
 
@@ -216,7 +320,8 @@ class _Event(_BackendBasedEntity):
 
 
 class _Catalogue(_BackendBasedEntity):
-    _fixed_keys = ['name', 'author', 'uuid', 'tags', 'predicate']
+    _fixed_keys_order = ('name', 'author', 'uuid', 'tags', 'predicate')
+    _fixed_keys = frozenset(_fixed_keys_order)
 
     def __init__(self, name: str, author: str,
                  uuid: Optional[str] = None,
@@ -228,19 +333,26 @@ class _Catalogue(_BackendBasedEntity):
 
         super().__init__()
 
-        self.name = name
-        self.author = author
-
+        # validate once and store the fixed fields directly, instead of going through __setattr__ for each
+        if not name:
+            raise ValueError('Catalogue name cannot be emtpy.')
         if not uuid:
-            self.uuid = str(uuid4())
+            uuid = str(uuid4())
         else:
-            self.uuid = uuid
-
-        self.tags = list(tags)
-        self.predicate = predicate
+            _check_uuid(uuid)
+        tags = list(tags)
+        _check_string_list(tags)
 
         _verify_attribute_names(kwargs)
-        self.__dict__.update(kwargs)
+        self.__dict__.update({
+            'name': name,
+            'author': author,
+            'uuid': uuid,
+            'tags': tags,
+            'predicate': predicate,
+            **kwargs,
+        })
+        self._variable_keys.update(kwargs)
 
         if _insert:
             self._backend_entity = backend().add_catalogue({
@@ -254,20 +366,35 @@ class _Catalogue(_BackendBasedEntity):
 
         self._in_ctor = False
 
+    @classmethod
+    def _from_backend(cls, cat: Dict, removed: bool) -> '_Catalogue':
+        # values coming from the backend have already been validated, bypass __init__ and __setattr__
+        c = cls.__new__(cls)
+        c.__dict__.update({
+            '_in_ctor': False,
+            '_removed': removed,
+            '_variable_keys': set(cat['attributes']),
+            'name': cat['name'],
+            'author': cat['author'],
+            'uuid': cat['uuid'],
+            'tags': list(cat['tags']),
+            'predicate': cat['predicate'],
+        })
+        c.__dict__.update(cat['attributes'])
+        c.__dict__['_backend_entity'] = cat['entity']
+        return c
+
     def is_dynamic(self):
         return self.predicate is not None
 
     def __setattr__(self, key, value):
         if key == 'uuid':
-            UUID(value, version=4)  # throws an exception if not valid
+            _check_uuid(value)
         elif key == 'name':
             if not value:
                 raise ValueError('Catalogue name cannot be emtpy.')
         elif key == 'tags':
-            if any(not isinstance(v, str) for v in value):
-                raise ValueError("a tag has to be a string")
-            if any(',' in v for v in value):
-                raise ValueError("a string-list value shall not contain a comma")
+            _check_string_list(value)
 
         super(_Catalogue, self).__setattr__(key, value)
 
@@ -309,32 +436,18 @@ def get_catalogues(base: Union[Predicate, _Event, None] = None, removed_items: b
 
     base_dict.update({'removed': removed_items})
 
-    catalogues = []
-    for cat in backend().get_catalogues(base_dict):
-        c = _Catalogue(cat['name'], cat['author'], cat['uuid'], cat['tags'], cat['predicate'],
-                       _insert=False, **cat['attributes'])
-        c._backend_entity = cat['entity']
-        c._removed = removed_items
-        catalogues += [c]
-    return catalogues
+    return [_Catalogue._from_backend(cat, removed_items) for cat in backend().get_catalogues(base_dict)]
 
 
 def __backend_to_event(ev: Dict, removed_item: bool) -> _Event:
-    e = _Event(ev['start'], ev['stop'], ev['author'], ev['uuid'], ev['tags'], ev['products'], ev['rating'],
-               **ev['attributes'], _insert=False)
-    e._removed = removed_item
-    e._backend_entity = ev['entity']
-    return e
+    return _Event._from_backend(ev, removed_item)
 
 
 def _get_events_from_predicate_or_none(base: Union[Predicate, None], removed_items: bool) -> List[_Event]:
     base_dict: Dict = {'removed': removed_items}
     if isinstance(base, Predicate):
         base_dict.update({'predicate': base})
-    events = []
-    for ev in backend().get_events(base_dict):
-        events.append(__backend_to_event(ev, removed_items))
-    return events
+    return [__backend_to_event(ev, removed_items) for ev in backend().get_events(base_dict)]
 
 
 @dataclass
@@ -1,4 +1,5 @@
 import datetime as dt
+import sys
 
 from typing import Union, TYPE_CHECKING
 from typing_extensions import Literal
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
 
 class Field:
     def __init__(self, name: str):
-        self.value = name
+        self.value = sys.intern(name) if isinstance(name, str) else name
 
     def __repr__(self):
         return f"Field('{self.value}')"
@@ -18,7 +19,7 @@ class Field:
 
 class Attribute:
     def __init__(self, name: str):
-        self.value = name
+        self.value = sys.intern(name) if isinstance(name, str) else name
 
     def __repr__(self):
         return f"Attribute('{self.value}')"
@@ -1,16 +1,15 @@
 from dataclasses import dataclass, field
 import datetime as dt
-import itertools
 import json
 import os
 from io import StringIO ,BytesIO
-from typing import Dict, List, Union, Tuple, Any, Optional, Type, Callable
+from typing import Dict, List, Set, Union, Tuple, Any, Optional, Type, Callable, TYPE_CHECKING
 from uuid import uuid4
 
+import orjson
 from sqlalchemy_utils import table_name
 
-from .base import get_catalogues, get_events, _Catalogue, _Event, backend, Session, _listify
-from .filtering import UUID
+from .base import get_events, _Catalogue, _Event, backend, Session, _listify
 
 
 @dataclass
@@ -42,10 +41,11 @@ class __CanonicalizedTSCatData:
             self._cat_dump.update({"events": self._events_uuids})
             self._data.catalogues.append(self._cat_dump)
 
-        def add_events(self, events: List[_Event]) -> None:
-            for event in events:
-                self._events_uuids.append(event.uuid)
-                self._data.events[event.uuid] = event.dump()
+        def add_backend_events(self, events: List[Dict[str, Any]]) -> None:
+            # dump rows coming from the backend directly, no _Event is created
+            for ev in events:
+                self._events_uuids.append(ev['uuid'])
+                self._data.events[ev['uuid']] = _Event._dump_from_backend(ev)
 
     def to_dict(self) -> Dict[str, List[Dict]]:
         return {
@@ -63,8 +63,10 @@ def __canonicalize_from_dict(data: Dict[str, Any]) -> __CanonicalizedTSCatData:
     uuids = [event['uuid'] for event in data['events']]
     events = backend().get_events_by_uuid_list(uuids)
 
-    for event in data['events'][:]:
+    new_events = []
+    for event in data['events']:
         if event['uuid'] not in events:
+            new_events.append(event)
             continue
 
         # to compare the existing event, the to-be-imported event is transformed to an in event from the backend
@@ -79,19 +81,25 @@ def __canonicalize_from_dict(data: Dict[str, Any]) -> __CanonicalizedTSCatData:
         if check_event != event:
             raise ValueError(f'Import: event with UUID {event["uuid"]} already exists in database, ' +
                              'but with different values.')
-        data['events'].remove(event)
+    data['events'] = new_events
 
-    for catalogue in data['catalogues'][:]:
-        check_catalogue = get_catalogues(UUID(catalogue['uuid']))
-        if len(check_catalogue) != 0:
+    catalogues = backend().get_catalogues_by_uuid_list([catalogue['uuid'] for catalogue in data['catalogues']])
 
-            e_tuple = get_events(check_catalogue[0])
-            assert isinstance(e_tuple, tuple)
-            events_uuids = [event.uuid for event in e_tuple[0]]
-            catalogue_dump = check_catalogue[0].dump()
+    new_catalogues = []
+    for catalogue in data['catalogues']:
+        cat = catalogues.get(catalogue['uuid'])
+        if cat is None or cat['entity'].removed:
+            new_catalogues.append(catalogue)
+        else:
+            check_catalogue = _Catalogue._from_backend(cat, False)
+
+            # only the uuids of its events are needed, take them from the backend rows
+            events_uuids = sorted(ev['uuid'] for ev in backend().get_events({'entity': cat['entity'],
+                                                                             'predicate': cat['predicate'],
+                                                                             'removed': False}))
+            catalogue_dump = check_catalogue.dump()
 
             # convert the existing catalogue so that it can be compared with the to-be-imported one
-            events_uuids.sort()
             catalogue_dump.update({'events': events_uuids})
             if catalogue_dump['predicate']:
                 catalogue_dump['predicate'] = str(catalogue_dump['predicate'])
@@ -100,7 +108,7 @@ def __canonicalize_from_dict(data: Dict[str, Any]) -> __CanonicalizedTSCatData:
             if catalogue_dump != catalogue:
                 raise ValueError(f'Import: catalogue with UUID {catalogue["uuid"]} already exists in database, ' +
                                  'but with different values.')
-            data['catalogues'].remove(catalogue)
+    data['catalogues'] = new_catalogues
 
     return __CanonicalizedTSCatData(data['catalogues'], {e['uuid']: e for e in data['events']})
 
@@ -109,6 +117,19 @@ def __import_canonicalized_dict(data: __CanonicalizedTSCatData) -> List[_Catalog
     event_of_uuid = {}
     catalogues: List[_Catalogue] = []
 
+    # fetch all already existing events referenced by the catalogues with one query, before creating anything
+    existing_uuids = {uuid for catalogue_dict in data.catalogues for uuid in catalogue_dict['events']} - \
+        data.events.keys()
+    if existing_uuids:
+        for uuid, ev in backend().get_events_by_uuid_list(list(existing_uuids)).items():
+            if not ev['entity'].removed:
+                event_of_uuid[uuid] = _Event._from_backend(ev, False)
+
+    missing_uuids = existing_uuids - event_of_uuid.keys()
+    if missing_uuids:
+        raise ValueError('Import: events referenced by catalogues are neither imported nor in the database ' +
+                         f'(or removed): {", ".join(sorted(missing_uuids))}')
+
     # import all new events
     with Session() as s:
         for event in data.events.values():
@@ -117,14 +138,7 @@ def __import_canonicalized_dict(data: __CanonicalizedTSCatData) -> List[_Catalog
             event_of_uuid[event['uuid']] = s.create_event(**event)
 
         for catalogue_dict in data.catalogues:
-            catalogue_events: List[_Event] = []
-            for uuid in catalogue_dict['events']:
-                if uuid in event_of_uuid:
-                    catalogue_events.append(event_of_uuid[uuid])
-                else:
-                    e_list = get_events(UUID(uuid))
-                    assert isinstance(e_list, list)
-                    catalogue_events.append(e_list[0])
+            catalogue_events = [event_of_uuid[uuid] for uuid in catalogue_dict['events']]
 
             del catalogue_dict['events']
 
@@ -136,12 +150,9 @@ def __import_canonicalized_dict(data: __CanonicalizedTSCatData) -> List[_Catalog
 
 
 ### JSON
-class __LocalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, dt.datetime):
-            return dt.datetime.isoformat(obj)
-        else:
-            return str(obj)
+def __json_default(obj: Any) -> str:
+    # datetimes are serialized by orjson itself (ISO 8601, like dt.datetime.isoformat), anything else as string
+    return str(obj)
 
 
 def export_json(catalogues: Union[List[_Catalogue], _Catalogue]) -> str:
@@ -149,15 +160,15 @@ def export_json(catalogues: Union[List[_Catalogue], _Catalogue]) -> str:
 
     for catalogue in _listify(catalogues):
         with __CanonicalizedTSCatData.DumpCatalogue(catalogue, data) as catalogue_data:
-            e_tuple = get_events(catalogue)
-            assert isinstance(e_tuple, tuple)
-            catalogue_data.add_events(e_tuple[0])
+            catalogue_data.add_backend_events(backend().get_events({'entity': catalogue._backend_entity,
+                                                                    'predicate': catalogue.predicate,
+                                                                    'removed': False}))
 
-    return json.dumps(data.to_dict(), cls=__LocalEncoder)
+    return orjson.dumps(data.to_dict(), default=__json_default).decode('utf-8')
 
 
 def __canonicalize_json_import(jsons: str) -> __CanonicalizedTSCatData:
-    import_dict = json.loads(jsons)
+    import_dict = orjson.loads(jsons)
     return __canonicalize_from_dict(import_dict)
 
 
@@ -174,9 +185,9 @@ def import_json_file(filename: str) -> List[_Catalogue]:
 
 ### VOTable (AMDA compatible)
 
-from astropy.io.votable import parse
-from astropy.io.votable.tree import VOTableFile, Resource, Table, \
-    Field as VOField
+# astropy is slow to import, it is only loaded once VOTable functions are used
+if TYPE_CHECKING:
+    from astropy.io.votable.tree import VOTableFile, Table, Field as VOField
 
 
 @dataclass
@@ -187,19 +198,21 @@ class __VOTableTSCatField:
     convert_tscat: Callable[[Any], Any]
     tscat_name: Optional[str] = None
 
-    def name(self, field: VOField) -> str:
+    def name(self, field: 'VOField') -> str:
         if self.tscat_name:
             return self.tscat_name
         return field.name
 
-    def match(self, field: VOField) -> bool:
+    def match(self, field: 'VOField') -> bool:
         for k, v in self.attr.items():
             if field.__getattribute__(k) != v:
                 return False
 
         return True
 
-    def make_vot_field(self, table: Table, name: str) -> VOField:
+    def make_vot_field(self, table: 'Table', name: str) -> 'VOField':
+        from astropy.io.votable.tree import Field as VOField
+
         if 'name' not in self.attr:
             return VOField(table, name=name, **self.attr)
         else:
@@ -246,7 +259,9 @@ def __vo_table_field_from(arg: Union[Type, str]) -> __VOTableTSCatField:
     return vtf
 
 
-def export_votable(catalogues: Union[List[_Catalogue], _Catalogue]) -> VOTableFile:
+def export_votable(catalogues: Union[List[_Catalogue], _Catalogue]) -> 'VOTableFile':
+    from astropy.io.votable.tree import VOTableFile, Resource, Table
+
     votable = VOTableFile()
 
     catalogues_list = _listify(catalogues)
@@ -274,10 +289,18 @@ def export_votable(catalogues: Union[List[_Catalogue], _Catalogue]) -> VOTableFi
 
         e_tuple = get_events(catalogue)
         assert isinstance(e_tuple, tuple)
-        # set of all attributes of any event
-        var_attrs = set(itertools.chain.from_iterable(event.variable_attributes().keys() for event in e_tuple[0]))
-        # set of all attributes of all events
-        var_attrs_intersect = set.intersection(*[set(event.variable_attributes().keys()) for event in e_tuple[0]])
+        # set of all attributes of any event and set of all attributes of all events, in one pass
+        var_attrs: Set[str] = set()
+        var_attrs_intersect: Optional[Set[str]] = None
+        for event in e_tuple[0]:
+            keys = event.variable_attributes().keys()
+            var_attrs.update(keys)
+            if var_attrs_intersect is None:
+                var_attrs_intersect = set(keys)
+            else:
+                var_attrs_intersect.intersection_update(keys)
+        if var_attrs_intersect is None:
+            var_attrs_intersect = set()
 
         # for the moment raise an error if there are attributes not present in every event
         if var_attrs != var_attrs_intersect:
@@ -295,10 +318,11 @@ def export_votable(catalogues: Union[List[_Catalogue], _Catalogue]) -> VOTableFi
 
         table.fields.extend([vtf.make_vot_field(votable, name) for name, vtf in attributes])
 
+        # fill the table column by column, all events are known to have all attributes (checked above)
         table.create_arrays(len(e_tuple[0]))
-        for i, event in enumerate(e_tuple[0]):
-            c = tuple(vtf.convert_vot(event.__dict__[k]) if k in event.__dict__ else '' for k, vtf in attributes)
-            table.array[i] = c
+        for column, (k, vtf) in zip(table.array.dtype.names, attributes):
+            convert = vtf.convert_vot
+            table.array[column] = [convert(event.__dict__[k]) for event in e_tuple[0]]
 
     return votable
 
@@ -309,7 +333,7 @@ def export_votable_str(catalogues: Union[List[_Catalogue], _Catalogue]) -> str:
     return content.getvalue().decode()
 
 
-def __canonicalize_votable_import(votable: VOTableFile, table_name: Optional[str] = None) -> __CanonicalizedTSCatData:
+def __canonicalize_votable_import(votable: 'VOTableFile', table_name: Optional[str] = None) -> __CanonicalizedTSCatData:
     author = 'VOTable Import'
     table_name = table_name or f'Imported Catalogue from {dt.datetime.now()}'
 
@@ -332,6 +356,8 @@ def __canonicalize_votable_import(votable: VOTableFile, table_name: Optional[str
         'events': [],
     }
 
+    seen_uuids: Set[str] = set()
+
     for i, table in enumerate(votable.iter_tables()):
         required_field_names: List[str] = ['Start Time', 'Stop Time']
         fields_vs_index: Dict[Tuple[int, str], __VOTableTSCatField] = {}
@@ -366,6 +392,8 @@ def __canonicalize_votable_import(votable: VOTableFile, table_name: Optional[str
         has_author_field = any(f[1] == 'author' for f in fields_vs_index.keys())
         has_uuid_field = any(f[1] == 'uuid' for f in fields_vs_index.keys())
 
+        columns = [(index, name, vtf.convert_tscat) for (index, name), vtf in fields_vs_index.items()]
+
         for l in table.array:
             event = {}
             if not has_author_field:
@@ -374,10 +402,11 @@ def __canonicalize_votable_import(votable: VOTableFile, table_name: Optional[str
             if not has_uuid_field:
                 event['uuid'] = str(uuid4())
 
-            for (index, name), vtf in fields_vs_index.items():
-                event[name] = vtf.convert_tscat(l[index])
+            for index, name, convert in columns:
+                event[name] = convert(l[index])
 
-            if not any(event['uuid'] == e['uuid'] for e in ddict['events']):
+            if event['uuid'] not in seen_uuids:
+                seen_uuids.add(event['uuid'])
                 ddict['events'].append(event)
 
             catalogue['events'].append(event['uuid'])  # type: ignore
@@ -387,12 +416,14 @@ def __canonicalize_votable_import(votable: VOTableFile, table_name: Optional[str
     return __canonicalize_from_dict(ddict)
 
 
-def import_votable(votable: VOTableFile, table_name: Optional[str] = None) -> List[_Catalogue]:
+def import_votable(votable: 'VOTableFile', table_name: Optional[str] = None) -> List[_Catalogue]:
     dict = __canonicalize_votable_import(votable, table_name=table_name)
     return __import_canonicalized_dict(dict)
 
 
 def import_votable_file(filename: str, table_name: Optional[str] = None) -> List[_Catalogue]:
+    from astropy.io.votable import parse
+
     if os.path.exists(filename):
         table_name = table_name or os.path.basename(filename)
         dict = __canonicalize_votable_import(parse(filename), table_name=table_name)
@@ -401,5 +432,7 @@ def import_votable_file(filename: str, table_name: Optional[str] = None) -> List
 
 
 def import_votable_str(xml_content: str, table_name: Optional[str] = None) -> List[_Catalogue]:
+    from astropy.io.votable import parse
+
     dict = __canonicalize_votable_import(parse(BytesIO(xml_content.encode())), table_name=table_name)
     return __import_canonicalized_dict(dict)
@@ -6,15 +6,17 @@ from ..filtering import Predicate, Comparison, Field, Attribute, All, Any, Match
 import pickle
 import datetime as dt
 import os
+import re
+from functools import lru_cache
 from shutil import copyfile
 from tempfile import mkdtemp
 import orjson
 from appdirs import user_data_dir
 
-from typing import Union, List, Dict, Type, Set
+from typing import Union, List, Dict, Type, Set, Optional, Pattern
 from typing_extensions import Literal
 
-from sqlalchemy import create_engine, and_, or_, not_, event, func, cast, String
+from sqlalchemy import create_engine, and_, or_, not_, event, func, cast, literal, select, String
 from sqlalchemy.orm import Session, Query
 from sqlalchemy.pool.base import _ConnectionFairy
 
@@ -29,6 +31,47 @@ def _deserialize_json(obj):
     return orjson.loads(obj)
 
 
+@lru_cache(maxsize=256)
+def _compiled_regex(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+def _regexp(pattern: str, value: Optional[str]) -> Optional[bool]:
+    # SQL REGEXP-function, called for each row: the pattern is compiled once and not looked up in re's cache
+    if value is None:
+        return None
+    return _compiled_regex(pattern).search(value) is not None
+
+
+_comparison_operators = {
+    '==': __eq__,
+    '!=': __ne__,
+    '<': __lt__,
+    '<=': __le__,
+    '>': __gt__,
+    '>=': __ge__,
+}
+
+
+def _estimated_cost(pred: Predicate) -> int:
+    # rough relative cost of evaluating a predicate for one row, used to put cheap terms first in AND/OR
+    if isinstance(pred, Comparison):
+        if isinstance(pred._lhs, Field):
+            return 1 if pred._lhs.value == 'uuid' else 10
+        return 20
+    elif isinstance(pred, Has):
+        return 20
+    elif isinstance(pred, In):
+        return 50
+    elif isinstance(pred, Match):
+        return 100
+    elif isinstance(pred, Not):
+        return _estimated_cost(pred._operand)
+    elif isinstance(pred, (All, Any)):
+        return sum(_estimated_cost(p) for p in pred._predicates)
+    return 1000  # InCatalogue: sub-queries on the association table
+
+
 class PredicateVisitor:
     def __init__(self, orm_class: Union[Type[orm.Event], Type[orm.Catalogue]]):
         self.visited_predicates: Set[int] = set()
@@ -39,45 +82,36 @@ class PredicateVisitor:
 
     def _visit_comparison(self, comp: Comparison):
         rhs = self._visit_literal(comp._rhs)
+        op = _comparison_operators[comp._op]
 
-        op_map = {
-            '==': __eq__,
-            '!=': __ne__,
-            '<': __lt__,
-            '<=': __le__,
-            '>': __gt__,
-            '>=': __ge__,
-        }
         if isinstance(comp._lhs, Field):
             lhs = getattr(self._orm_class, comp._lhs.value)
-            return op_map[comp._op](lhs, rhs)
+            return op(lhs, rhs)
 
         elif isinstance(comp._lhs, Attribute):
             return and_(
                 self._orm_class.attributes[comp._lhs.value] != 'null',
-                op_map[comp._op](self._orm_class.attributes[comp._lhs.value], _serialize_json(rhs))
+                op(self._orm_class.attributes[comp._lhs.value], _serialize_json(rhs))
             )
 
     def _visit_all(self, all_: All):
-        return and_(self.visit_predicate(pred) for pred in all_._predicates)
+        return and_(self.visit_predicate(pred) for pred in sorted(all_._predicates, key=_estimated_cost))
 
     def _visit_any(self, any_: Any):
-        return or_(self.visit_predicate(pred) for pred in any_._predicates)
+        return or_(self.visit_predicate(pred) for pred in sorted(any_._predicates, key=_estimated_cost))
 
     def _visit_not(self, not__: Not):
         return not_(self.visit_predicate(not__._operand))
 
-    def _visit_in(self, in_: In):  # cast lists and json to string and regex-match
+    def _visit_in(self, in_: In):  # cast lists and json to string and search
         if isinstance(in_._rhs, Field):
             f = cast(getattr(self._orm_class, in_._rhs.value), String)
-            v = in_._lhs
-            # ugly, sqlite's Regex seems not to support (?:,|^)-regexes
-            return or_(f == v,
-                       f.regexp_match(f'^{v},'),
-                       f.regexp_match(f',{v},'),
-                       f.regexp_match(f',{v}$'))
+            # string-lists are stored comma-separated: surround with commas to find the value in any position
+            return func.instr(literal(',').concat(f).concat(','), f',{in_._lhs},') > 0
         elif isinstance(in_._rhs, Attribute):
-            return cast(self._orm_class.attributes[in_._rhs.value], String).regexp_match(f'"{in_._lhs}"')
+            # plain substring-search of the JSON-quoted value, no need to run the regex-engine for each row
+            f = cast(self._orm_class.attributes[in_._rhs.value], String)
+            return func.instr(f, _serialize_json(in_._lhs)) > 0
 
     def _visit_in_catalogue(self, in_catalogue: InCatalogue):
         if self._orm_class == orm.Catalogue:
@@ -85,11 +119,16 @@ class PredicateVisitor:
 
         if in_catalogue.catalogue is None:
             return ~getattr(self._orm_class, "catalogues").any()
-        elif in_catalogue.catalogue.predicate is not None:
-            return or_(getattr(self._orm_class, "catalogues").any(id=in_catalogue.catalogue._backend_entity.id),
-                       self.visit_predicate(in_catalogue.catalogue.predicate))
+
+        # uncorrelated sub-select: SQLite builds the set of event-ids once instead of probing per event
+        assoc = orm.event_in_catalogue_association_table
+        assigned = self._orm_class.id.in_(
+            select(assoc.c.event_id).where(assoc.c.catalogue_id == in_catalogue.catalogue._backend_entity.id))
+
+        if in_catalogue.catalogue.predicate is not None:
+            return or_(assigned, self.visit_predicate(in_catalogue.catalogue.predicate))
         else:
-            return getattr(self._orm_class, "catalogues").any(id=in_catalogue.catalogue._backend_entity.id)
+            return assigned
 
     def _visit_has(self, has_: Has):
         return self._orm_class.attributes[has_._operand.value] != 'null'
@@ -147,6 +186,11 @@ class Backend:
                                     json_serializer=_serialize_json,
                                     json_deserializer=_deserialize_json)
 
+        # replace the dialect's REGEXP-function by one using pre-compiled patterns
+        @event.listens_for(self.engine, "connect")
+        def do_connect(dbapi_connection, connection_record):
+            dbapi_connection.create_function("regexp", 2, _regexp)
+
         if in_memory:
             import sqlite3
             source = sqlite3.connect("")
@@ -209,15 +253,21 @@ class Backend:
                          event['rating'],
                          event['attributes'])
 
+    def add_events(self, events: List[Dict]) -> List[orm.Event]:
+        return [self.add_event(event) for event in events]
+
     def add_events_to_catalogue(self, catalogue: orm.Catalogue, events: List[orm.Event]) -> None:
+        existing = set(catalogue.events)
         for e in events:
-            if e in catalogue.events:
+            if e in existing:
                 raise ValueError('Event is already in catalogue.')
         catalogue.events.extend(events)
 
     def remove_events_from_catalogue(self, catalogue: orm.Catalogue, events: List[orm.Event]) -> None:
-        for e in events:
-            catalogue.events.remove(e)
+        to_remove = set(events)
+        if not to_remove.issubset(catalogue.events):
+            raise ValueError('Event is not in catalogue.')
+        catalogue.events = [e for e in catalogue.events if e not in to_remove]
 
     def update_field(self, entity: Union[orm.Event, orm.Catalogue], key: str, value) -> None:
         if key in ['predicate']:
@@ -236,6 +286,18 @@ class Backend:
                       orm_class: Union[Type[orm.Event], Type[orm.Catalogue]],
                       field: Union[Literal['events'], Literal['catalogues']],
                       removed: bool = False) -> Query:
+        if base.get('predicate', None) is None and base.get('entity') is not None:
+            # plain membership: join the association table instead of an EXISTS-subquery per row
+            assoc = orm.event_in_catalogue_association_table
+            if field == 'catalogues':
+                own_id, other_id = assoc.c.event_id, assoc.c.catalogue_id
+            else:
+                own_id, other_id = assoc.c.catalogue_id, assoc.c.event_id
+            return self.session.query(orm_class, literal(True)) \
+                .join(assoc, own_id == orm_class.id) \
+                .filter(other_id == base['entity'].id, getattr(orm_class, 'removed') == removed) \
+                .order_by(orm_class.id)
+
         f = None
 
         if base.get('predicate', None) is not None:
@@ -257,7 +319,8 @@ class Backend:
         q = self.session.query(orm_class, entity_filter)
         if f is not None:
             q = q.filter(f)
-        return q
+        # SQLite may answer ORed IN-sub-selects as a union of lookups, keep the results in table order
+        return q.order_by(orm_class.id)
 
     def get_catalogues(self, base: Dict = {}) -> List[Dict]:
         catalogues = []
@@ -308,6 +371,20 @@ class Backend:
 
         return d
 
+    def get_catalogues_by_uuid_list(self, uuids: List[str]) -> Dict[str, Dict]:
+        d = {}
+        for c in self.session.query(orm.Catalogue).filter(orm.Catalogue.uuid.in_(uuids)).all():
+            d[c.uuid] = {
+                "name": c.name,
+                "author": c.author,
+                "uuid": c.uuid,
+                "tags": c.tags,
+                "predicate": pickle.loads(c.predicate) if c.predicate else None,
+                "attributes": c.attributes,
+                "entity": c}
+
+        return d
+
     def add_and_flush(self, entity_list: List[Union[orm.Event, orm.Catalogue]]):
         self.session.add_all(entity_list)
         self.session.flush()